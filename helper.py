@@ -1,11 +1,15 @@
 # General packages
+import asyncio
+import concurrent.futures
 import datetime
 import pytz
+import numpy as np
 import pandas as pd
 import sys
 
 # Python data class
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 # Refinitiv UI components
 from refinitiv_widgets import ProgressBar
@@ -14,10 +18,14 @@ from refinitiv_widgets import ProgressBar
 import refinitiv.data as rd
 from refinitiv.data.content import historical_pricing
 
+# Allow our requests to be awaited within the notebook's running event loop
+import nest_asyncio
+nest_asyncio.apply()
+
 # Refinitiv UI
 from dataclasses import dataclass, field
 from refinitiv_widgets import DatetimePicker
-from ipywidgets import Box
+from ipywidgets import Box, Output
 
 
 # Charting
@@ -42,22 +50,19 @@ class DatePicker:
     _today: datetime.datetime = field(init=False, default=datetime.date.today(), repr=False)
     _time_range: DatetimePicker = field(init=False, repr=False)  
     
+    # Default dates, keyed by (cnt, today), shared across all instances
+    _date_cache: ClassVar[dict] = {}
+    
     # Post initialization
     def __post_init__(self) -> None:
         self.cnt = 5 if self.cnt < 1 or self.cnt > 10 else self.cnt
         
-        # Initialize DatePicker instances
-        delta = 1
-        for i in range(self.cnt):
-            # Inner loop to ignore weekends
-            while True:
-                d = self._today-datetime.timedelta(days=delta)
-                if d.weekday() < 5:
-                    break;
-                delta += 1
-                
-            self._dates.append(DatetimePicker(css=self._date_css, value=[f'{d}'], weekdays_only=True))
-            delta += 1
+        # Initialize DatePicker instances - the most recent business days (ignoring weekends)
+        key = (self.cnt, self._today)
+        if key not in DatePicker._date_cache:
+            bdays = np.busday_offset(np.datetime64(self._today, 'D'), -np.arange(1, self.cnt+1), roll='forward')
+            DatePicker._date_cache[key] = list(bdays.astype(str))
+        self._dates = [DatetimePicker(css=self._date_css, value=[d], weekdays_only=True) for d in DatePicker._date_cache[key]]
             
         # Initialize Time Picker instance
         value=["1900-01-01T09:30", "1900-01-01T16:00"]
@@ -90,15 +95,15 @@ class DatePicker:
         """
         Returns: The current date values.
         """
-        return [datetime.datetime.strptime(x.value[0], "%Y-%m-%d") for x in self._dates]
+        return [datetime.datetime.fromisoformat(x.value[0]) for x in self._dates]
     
     @property
     def time_range(self):
         """
         Returns: The current datetime values.
         """
-        return [datetime.datetime.strptime(self._time_range.value[0], "%Y-%m-%dT%H:%M"),
-                datetime.datetime.strptime(self._time_range.value[1], "%Y-%m-%dT%H:%M")]
+        value = self._time_range.value
+        return [datetime.datetime.fromisoformat(value[0]), datetime.datetime.fromisoformat(value[1])]
     
 
 @dataclass
@@ -131,27 +136,48 @@ class Intraday:
     """
     _tz: str = field(init=False, repr=False)
     _label: str = field(init=False, repr=False)
-    _prices: pd.DataFrame = field(init=False, repr=False)
-    _volumes: pd.DataFrame = field(init=False, repr=False)
+    _prices: pd.DataFrame = field(init=False, default=None, repr=False)
+    _volumes: pd.DataFrame = field(init=False, default=None, repr=False)
+    
+    # Calculated measures - a column per day, aligned to the minutes within the trading window
+    _price_matrix: np.ndarray = field(init=False, default=None, repr=False)
+    _volume_matrix: np.ndarray = field(init=False, default=None, repr=False)
+    _minute_index: pd.DatetimeIndex = field(init=False, default=None, repr=False)
+    _day_labels: list = field(init=False, default_factory=list, repr=False)
+    
+    # Worker threads used to request summaries when the library does not provide an async interface
+    _executor: concurrent.futures.ThreadPoolExecutor = field(init=False, default=None, repr=False, compare=False)
+    _executor_workers: int = field(init=False, default=0, repr=False, compare=False)
+    _plot_future: concurrent.futures.Future = field(init=False, default=None, repr=False, compare=False)
+    
+    # Timezone/label details, keyed by RIC, shared across all instances
+    _tz_cache: ClassVar[dict] = {}
+    
+    # Summary fields (price/volume) and the widest span of dates (in days) retrieved within a single request
+    _price: ClassVar[str] = 'TRDPRC_1'
+    _volume: ClassVar[str] = 'ACVOL_UNS'
+    _bulk_days: ClassVar[int] = 7
         
     def calculate_measures(self, ric, dates, time_range, measure=None):
         """Based on the specific instrument (RIC), for the specified dates, generate the price and volume measures used to evaluate the intraday activity for the
            specified trading window.  Refer to the 'Calculate and capture measure' section for details related to the 'measure' parameter.
         """         
-        price = 'TRDPRC_1'
-        volume = 'ACVOL_UNS'
-        
         # Dates may be a single datetime instance
         if not isinstance(dates, list):
             dates = [dates]
         if len(dates) < 1 or len(time_range) != 2:
             return
     
-        # Containers (prices/volumes)
-        prices = []
-        volumes = []
+        # Containers (prices/volumes) - each day is aligned to a common minute index for the trading window
+        minute_index = pd.date_range(time_range[0], time_range[1], freq='min')
+        first_minute = time_range[0].hour*60 + time_range[0].minute
+        day_labels = [None] * len(dates)
+        prices = np.full((len(minute_index), len(dates)), np.nan)
+        volumes = np.full((len(minute_index), len(dates)), np.nan)
         self._prices = None
         self._volumes = None
+        self._price_matrix = None
+        self._volume_matrix = None
     
         # Simple progress bar
         pb = ProgressBar(value=100, color="green")
@@ -161,65 +187,56 @@ class Intraday:
     
         # Retrieve timezone for our RIC
         if self.__get_timezone(ric):    
-            # Iterate through out dates container, defining a time range and request for prices
-            for date in dates:
-                pb.value += 100/len(dates)   # Progress bar increment
-
-                # Day to retrieve intraday values - define the local trading start/end hours
-                start = datetime.datetime(date.year, date.month, date.day, time_range[0].hour, 
-                                          time_range[0].minute, 0, tzinfo=pytz.timezone(self._tz))
-                end = datetime.datetime(date.year, date.month, date.day, 
-                                        time_range[1].hour, time_range[1].minute, 0, tzinfo=pytz.timezone(self._tz))
-
-                # Convert to UTC as required by the historical pricing service
-                start = start.astimezone(pytz.utc).replace(tzinfo=pytz.utc)
-                end = end.astimezone(pytz.utc).replace(tzinfo=pytz.utc)
+            # Timezone the instrument trades in - resolved once for all dates
+            local_tz = pytz.timezone(self._tz)
+            
+            # Dates within a compact range are retrieved using a single request, otherwise request the summaries 
+            # for all dates concurrently - results are returned in the order of our dates container
+            days = [d.date() if isinstance(d, datetime.datetime) else d for d in dates]
+            if not hasattr(historical_pricing.summaries.Definition, 'get_data_async'):
+                self.__prepare_executor(len(days))
+            results = None
+            if (max(days) - min(days)).days <= self._bulk_days:
+                results = asyncio.run(self.__get_bulk_summaries(ric, days, time_range, local_tz, measure))
+            if results is None:
+                # Progress bar increment as each request completes - throttled to limit widget updates
+                completed = 0
+                step = max(1, len(days)//10)
+                def progress(task):
+                    nonlocal completed
+                    completed += 1
+                    if completed % step == 0:
+                        pb.value = int(100*completed/len(days))
+                
+                async def fetch_all():
+                    tasks = [asyncio.ensure_future(self.__get_summaries(ric, day, time_range, local_tz, measure)) for day in days]
+                    for task in tasks:
+                        task.add_done_callback(progress)
+                    return await asyncio.gather(*tasks)
+                results = asyncio.run(fetch_all())
+            
+            if pb.value < 100:
+                pb.value = 100
 
-                try:               
-                    # Retrieve our minute price bars for the specified day
-                    response = historical_pricing.summaries.Definition(
-                                        universe=ric, fields=[price, volume],
-                                        interval=historical_pricing.Intervals.MINUTE,
-                                        start=start, end=end).get_data()
-                    df = response.data.df.dropna()
+            for i, result in enumerate(results):
+                if result is not None:
+                    day_labels[i], index, day_prices, day_volumes = result
                     
-                    if not df.empty:
-                        # Mark the date index as UTC
-                        df = df.tz_localize('UTC')
-
-                        # Convert the date index for local time (for presentation)
-                        index=df.index.tz_convert(self._tz)
-                        df = df.set_index(index)
-
-                        # Ensure our values our numeric (required for the measures calculation below)
-                        df[price]=pd.to_numeric(df.iloc(1)[0])
-
-                        # Derive the measure
-                        if measure == 'net':
-                            df[price] = df[price] - df[price][0]
-                        elif measure == 'pct':
-                            df[price] = (df[price] - df[price][0]) / df[price][0]
-
-                        # Prepare the data for charting
-                        price_df = df.drop([volume], axis=1)
-                        volume_df = df.drop([price], axis=1)
+                    # Position of each bar within our minute index
+                    rows = np.asarray(index.hour*60 + index.minute) - first_minute
+                    valid = (rows >= 0) & (rows < len(minute_index))
+                    prices[rows[valid], i] = day_prices[valid]
+                    volumes[rows[valid], i] = day_volumes[valid]
 
-                        price_df.rename(columns={price:df.index.max().date()},inplace=True)
-                        price_df.index = price_df.index.time
-                        volume_df.rename(columns={volume:df.index.max().date()},inplace=True)
-                        volume_df.index = volume_df.index.time
-
-                        prices.append(price_df)
-                        volumes.append(volume_df)
-                    else:
-                        print(f'No data returned for RIC: {ric} for the range: {start}:{end}. Ignoring.')
-                except Exception as e:
-                    print(f"Issue retrieving data for RIC: {ric} for the range: {start}:{end}.  Ignoring\n\t{e}")             
-
-        # Organize the results into a dataframe
-        if (len(prices) > 0):
-            self._prices = pd.concat(prices, axis=1, sort=False).dropna()
-            self._volumes = pd.concat(volumes, axis=1, sort=False).dropna()
+        # Capture the results - ignoring any dates that failed to generate measures.  The dataframes are prepared on request.
+        filled = [i for i, label in enumerate(day_labels) if label is not None]
+        if (len(filled) > 0):
+            # Bars with missing values were dropped per day - only ignore the minutes in which no day traded
+            traded = ~np.isnan(prices[:, filled]).all(axis=1)
+            self._minute_index = minute_index[traded]
+            self._day_labels = [day_labels[i] for i in filled]
+            self._price_matrix = prices[np.ix_(traded, filled)]
+            self._volume_matrix = volumes[np.ix_(traded, filled)]
         else:
             print("Failed to generate any measures")
         print("**Done")
@@ -230,14 +247,18 @@ class Intraday:
         """After calculating the measures, the intraday prices for the selected days are generated.
            Returns: Pandas Dataframe representing the prices for each day generated
         """        
-        return self._prices if hasattr(self, '_prices') else None
+        if self._prices is None and self._price_matrix is not None:
+            self._prices = pd.DataFrame(self._price_matrix, index=self._minute_index.time, columns=self._day_labels)
+        return self._prices
     
     @property
     def volumes(self):
         """After calculating the measures, the intraday trading volumes for the selected days are generated.
            Returns: Pandas Dataframe representing the volumes for each day generated
         """          
-        return self._volumes if hasattr(self, '_volumes') else None
+        if self._volumes is None and self._volume_matrix is not None:
+            self._volumes = pd.DataFrame(self._volume_matrix, index=self._minute_index.time, columns=self._day_labels)
+        return self._volumes
     
     @property
     def label(self):
@@ -245,19 +266,153 @@ class Intraday:
         """
         return self._label
     
-    def plot(self, title, theme='solar', dimensions=(1100,500)):
+    def plot(self, title, theme='solar', dimensions=(1100,500), plot_async=False):
         """After calculating the measures, plot the prices and volume graphs defined within the trading window for the specified instrument.
+           When 'plot_async' is set, the graphs are rendered in the background and the call returns immediately.  Refer to 'wait'.
         """         
-        if self._prices is not None:
+        if self._price_matrix is not None:
             if title is None:
-                title = _label
-            self.prices.iplot(theme=theme, title=title, dimensions=dimensions)
-            self.volumes.iplot(theme=theme, kind='bar', barmode='stack', dimensions=dimensions)
+                title = self._label
+            if plot_async:
+                # Display an output area the graphs are rendered into once prepared.  The measures are captured here, 
+                # as a subsequent calculation may replace them while rendering.
+                output = Output()
+                display(output)
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                self._plot_future = executor.submit(self.__render, output, self.prices, self.volumes, title, theme, dimensions)
+                executor.shutdown(wait=False)
+            else:
+                self.prices.iplot(theme=theme, title=title, dimensions=dimensions)
+                self.volumes.iplot(theme=theme, kind='bar', barmode='stack', dimensions=dimensions)
         else:
             print("No measures generated")
     
+    def wait(self):
+        """After plotting asynchronously, wait for the graphs to be rendered.
+        """
+        if self._plot_future is not None:
+            self._plot_future.result()
+    
+    # Prepare the price and volume graphs and render them within the specified output area
+    def __render(self, output, prices, volumes, title, theme, dimensions):
+        try:
+            output.append_display_data(prices.iplot(theme=theme, title=title, dimensions=dimensions, asFigure=True))
+            output.append_display_data(volumes.iplot(theme=theme, kind='bar', barmode='stack', dimensions=dimensions, asFigure=True))
+        except Exception as e:
+            # Report the failure within the output area - otherwise only visible when waiting on the render
+            output.append_stderr(f"Failed to render the graphs: {e}\n")
+            raise
+    
+    # Define the trading window for the specified day, in UTC as required by the historical pricing service
+    def __get_window(self, date, time_range, local_tz):
+        # Day to retrieve intraday values - define the local trading start/end hours
+        # Note: pytz zones must be applied using localize() to resolve the correct (DST) offset for the day
+        start = local_tz.localize(datetime.datetime.combine(date, time_range[0].time()))
+        end = local_tz.localize(datetime.datetime.combine(date, time_range[1].time()))
+
+        # Convert to UTC as required by the historical pricing service
+        return start.astimezone(pytz.utc), end.astimezone(pytz.utc)
+    
+    # Size our (reusable) worker threads for blocking requests - the threads are replaced only when more are required
+    def __prepare_executor(self, requests):
+        workers = min(requests, 8)
+        if self._executor is None or self._executor_workers < workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+            self._executor_workers = workers
+    
+    # Retrieve our minute price bars for the specified range, with the date index converted for local time (for presentation)
+    async def __request_summaries(self, ric, start, end, local_tz):
+        definition = historical_pricing.summaries.Definition(
+                            universe=ric, fields=[self._price, self._volume],
+                            interval=historical_pricing.Intervals.MINUTE,
+                            start=start, end=end)
+        if hasattr(definition, 'get_data_async'):
+            response = await definition.get_data_async()
+        else:
+            # Blocking request - run within our (reusable) worker threads to allow requests to run concurrently
+            response = await asyncio.get_running_loop().run_in_executor(self._executor, definition.get_data)
+        df = response.data.df
+        if df.empty:
+            return df
+
+        # Ensure our values our numeric (required for the measures calculation) and ignore incomplete bars
+        values = df[[self._price, self._volume]].to_numpy(dtype='float64', na_value=np.nan)
+        mask = ~np.isnan(values).any(axis=1)
+        
+        # Mark the date index as UTC and convert for local time
+        index = pd.DatetimeIndex(df.index[mask]).tz_localize('UTC').tz_convert(local_tz)
+        return pd.DataFrame(values[mask], index=index, columns=[self._price, self._volume])
+    
+    # Retrieve the intraday summaries for our RIC for the specified day
+    async def __get_summaries(self, ric, date, time_range, local_tz, measure):
+        start, end = self.__get_window(date, time_range, local_tz)
+        try:               
+            df = await self.__request_summaries(ric, start, end, local_tz)
+            if not df.empty:
+                return self.__prepare_measures(df, measure)
+            else:
+                print(f'No data returned for RIC: {ric} for the range: {start}:{end}. Ignoring.')
+        except Exception as e:
+            print(f"Issue retrieving data for RIC: {ric} for the range: {start}:{end}.  Ignoring\n\t{e}")
+        return None
+    
+    # Retrieve the intraday summaries for our RIC for all specified days using a single request.  Returns None when the 
+    # request failed or the response did not cover the full range (the service limits the number of bars returned per request).
+    async def __get_bulk_summaries(self, ric, dates, time_range, local_tz, measure):
+        start, _ = self.__get_window(min(dates), time_range, local_tz)
+        _, end = self.__get_window(max(dates), time_range, local_tz)
+        try:
+            df = await self.__request_summaries(ric, start, end, local_tz)
+            
+            # The service returns the most recent bars when the range exceeds its limit.  A response starting after the first 
+            # business day of our range indicates the earliest days were cut off - the days must be requested individually.
+            first_day = np.busday_offset(np.datetime64(min(dates), 'D'), 0, roll='forward').item()
+            if not df.empty and df.index.min().date() > first_day:
+                return None
+            
+            # Filter our bars to the trading window and break them out by day
+            days = {}
+            if not df.empty:
+                df = df.between_time(time_range[0].time(), time_range[1].time())
+                days = dict(tuple(df.groupby(df.index.date)))
+        except Exception as e:
+            print(f"Issue retrieving data for RIC: {ric} for the range: {start}:{end}.  Requesting each date individually\n\t{e}")
+            return None
+        
+        results = []
+        for date in dates:
+            if date in days:
+                results.append(self.__prepare_measures(days[date], measure))
+            else:
+                print(f'No data returned for RIC: {ric} for the date: {date}. Ignoring.')
+                results.append(None)
+        return results
+    
+    # Derive the price and volume measures for a single day of minute bars
+    def __prepare_measures(self, df, measure):
+        values = df.to_numpy()
+        prices = values[:, 0]
+
+        # Derive the measure based on the first trade of the day
+        base = prices[0]
+        if measure == 'net':
+            prices = prices - base
+        elif measure == 'pct':
+            prices = (prices - base) / base
+
+        # Day label (all bars fall within the same local trading day), local bar times and the measures for charting
+        return df.index[0].date(), df.index, prices, values[:, 1]
+    
     # Retrieve timezone for our RIC
     def __get_timezone(self, ric):
+        # Timezone details for the RIC were previously retrieved
+        cached = Intraday._tz_cache.get(ric)
+        if cached is not None:
+            self._tz, self._label = cached
+            return True
+        
         success = False
         try:
             # The following code segment fails and will be addressed under ticket: EAPI-5733
@@ -267,11 +422,17 @@ class Intraday:
             #if not df.empty:
             #    self._tz = df.iat[0,1]
             #    self._label = f'{df.iat[0, 2]} (Timezone: {self._tz})'
-            tz = rd.get_data(ric, ["TR.MASOperatingTZ"])
-            nm = rd.get_data(ric, ["CF_NAME"])
+            #
+            # Until then, both requests are issued concurrently.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                tz_request = executor.submit(rd.get_data, ric, ["TR.MASOperatingTZ"])
+                nm_request = executor.submit(rd.get_data, ric, ["CF_NAME"])
+                tz = tz_request.result()
+                nm = nm_request.result()
             if not tz.empty:
                 self._tz = tz.iat[0,1]
                 self._label = f'{nm.iat[0,1]} (Timezone: {self._tz})'
+                Intraday._tz_cache[ric] = (self._tz, self._label)
                 success = True
         except Exception as e:
             print(f"An exception occurred: {e}")